@@ -1,20 +1,21 @@
 import re
 import os
-import glob
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 os.chdir(r"C:\Users\Reza\Projects\NasNet\apps\backend")
 
 # Read generated.go
-with open("graph/generated.go", "r", encoding="utf-8", errors="replace") as f:
-    content = f.read()
+content = Path("graph/generated.go").read_text(encoding="utf-8", errors="replace")
 
 # Extract interface methods
+iface_method_re = re.compile(r"\t(\w+)\(")
 interfaces = {}
 for iface_name in ["MutationResolver", "QueryResolver", "SubscriptionResolver"]:
-    pattern = f"type {iface_name} interface {{([^}}]+)}}"
-    match = re.search(pattern, content, re.DOTALL)
+    iface_re = re.compile(f"type {iface_name} interface {{([^}}]+)}}", re.DOTALL)
+    match = iface_re.search(content)
     if match:
-        methods = re.findall(r"\t(\w+)\(", match.group(1))
+        methods = iface_method_re.findall(match.group(1))
         interfaces[iface_name] = set(methods)
 
 # Find implemented methods by scanning Go files directly
@@ -24,18 +25,35 @@ resolver_types = {
     "SubscriptionResolver": "subscriptionResolver",
 }
 
-for iface_name, receiver in resolver_types.items():
+receiver_ifaces = {receiver: iface_name for iface_name, receiver in resolver_types.items()}
+method_re = re.compile(
+    rf"func \(r \*({'|'.join(map(re.escape, receiver_ifaces))})\) (\w+)\("
+)
+
+with os.scandir("graph/resolver") as it:
+    files = [
+        e.path
+        for e in it
+        if e.is_file() and e.name.endswith(".go") and not e.name.endswith("_test.go")
+    ]
+
+
+def scan(path):
+    """Collect the resolver methods implemented in a single Go file."""
+    data = Path(path).read_text(encoding="utf-8", errors="replace")
+    found = {iface_name: set() for iface_name in resolver_types}
+    for m in method_re.finditer(data):
+        found[receiver_ifaces[m.group(1)]].add(m.group(2))
+    return found
+
+
+with ThreadPoolExecutor(max_workers=8) as ex:
+    results = list(ex.map(scan, files))
+
+for iface_name in resolver_types:
     implemented = set()
-    pattern_str = rf"func \(r \*{receiver}\) (\w+)\("
-
-    for gofile in glob.glob("graph/resolver/*.go"):
-        if gofile.endswith("_test.go"):
-            continue
-        with open(gofile, "r", encoding="utf-8", errors="replace") as f:
-            for line in f:
-                m = re.search(pattern_str, line)
-                if m:
-                    implemented.add(m.group(1))
+    for found in results:
+        implemented |= found[iface_name]
 
     required = interfaces.get(iface_name, set())
     missing = sorted(required - implemented)
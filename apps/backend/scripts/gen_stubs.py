@@ -1,11 +1,13 @@
+import io
 import re
 import os
+from functools import lru_cache
+from pathlib import Path
 
 os.chdir(r"C:\Users\Reza\Projects\NasNet\apps\backend")
 
 # Read generated.go
-with open("graph/generated.go", "r", encoding="utf-8", errors="replace") as f:
-    content = f.read()
+content = Path("graph/generated.go").read_text(encoding="utf-8", errors="replace")
 
 missing_mutations = [
     "CreateRoutingChain", "DeleteInstance", "InstallService",
@@ -30,37 +32,41 @@ missing_subscriptions = [
 # Extract interface blocks
 interfaces = {}
 for iface_name in ["MutationResolver", "QueryResolver", "SubscriptionResolver"]:
-    pattern = f"type {iface_name} interface {{([^}}]+)}}"
-    match = re.search(pattern, content, re.DOTALL)
+    iface_re = re.compile(f"type {iface_name} interface {{([^}}]+)}}", re.DOTALL)
+    match = iface_re.search(content)
     if match:
         interfaces[iface_name] = match.group(1)
 
+# Index method signatures by name once per interface
+def index_iface(body):
+    """Map each method name in an interface body to its signature line."""
+    out = {}
+    for line in body.splitlines():
+        s = line.strip()
+        if not s or not s[0].isalpha():
+            continue
+        name = s.split("(", 1)[0]
+        out[name] = s
+    return out
+
+sig_map = {iface_name: index_iface(body) for iface_name, body in interfaces.items()}
+
 # Generate stubs
-stubs = []
-stubs.append('package resolver')
-stubs.append('')
-stubs.append('// This file contains stub implementations for GraphQL resolver methods')
-stubs.append('// that are defined in the schema but not yet fully implemented.')
-stubs.append('// Generated to satisfy the interface requirements.')
-stubs.append('')
-stubs.append('import (')
-stubs.append('\t"context"')
-stubs.append('\t"fmt"')
-stubs.append('')
-stubs.append('\t"backend/graph/model"')
-stubs.append(')')
-stubs.append('')
-
-def extract_method_sig(iface_body, method_name):
-    """Extract full method signature from interface body."""
-    # Find the line with this method
-    lines = iface_body.split("\n")
-    for line in lines:
-        line = line.strip()
-        if line.startswith(method_name + "("):
-            return line
-    return None
+buf = io.StringIO()
+buf.write('package resolver\n')
+buf.write('\n')
+buf.write('// This file contains stub implementations for GraphQL resolver methods\n')
+buf.write('// that are defined in the schema but not yet fully implemented.\n')
+buf.write('// Generated to satisfy the interface requirements.\n')
+buf.write('\n')
+buf.write('import (\n')
+buf.write('\t"context"\n')
+buf.write('\t"fmt"\n')
+buf.write('\n')
+buf.write('\t"backend/graph/model"\n')
+buf.write(')\n')
 
+@lru_cache(maxsize=None)
 def parse_return_type(sig):
     """Parse return type(s) from method signature."""
     # Extract return part after the last )
@@ -73,6 +79,7 @@ def parse_return_type(sig):
         ret = ret[1:-1]
     return ret
 
+@lru_cache(maxsize=None)
 def gen_zero_return(ret_str):
     """Generate zero value return statement."""
     parts = [p.strip() for p in ret_str.split(",")]
@@ -105,44 +112,43 @@ def gen_zero_return(ret_str):
 
 # Generate mutation stubs
 for method in missing_mutations:
-    sig = extract_method_sig(interfaces["MutationResolver"], method)
+    sig = sig_map["MutationResolver"].get(method)
     if sig:
         ret = parse_return_type(sig)
         zero = gen_zero_return(ret)
-        stubs.append(f'// {method} is the resolver for the {method[0].lower() + method[1:]} field.')
-        stubs.append(f'func (r *mutationResolver) {sig} {{')
-        stubs.append(f'\treturn {zero}')
-        stubs.append('}')
-        stubs.append('')
+        buf.write('\n')
+        buf.write(f'// {method} is the resolver for the {method[0].lower() + method[1:]} field.\n')
+        buf.write(f'func (r *mutationResolver) {sig} {{\n')
+        buf.write(f'\treturn {zero}\n')
+        buf.write('}\n')
 
 # Generate query stubs
 for method in missing_queries:
-    sig = extract_method_sig(interfaces["QueryResolver"], method)
+    sig = sig_map["QueryResolver"].get(method)
     if sig:
         ret = parse_return_type(sig)
         zero = gen_zero_return(ret)
-        stubs.append(f'// {method} is the resolver for the {method[0].lower() + method[1:]} field.')
-        stubs.append(f'func (r *queryResolver) {sig} {{')
-        stubs.append(f'\treturn {zero}')
-        stubs.append('}')
-        stubs.append('')
+        buf.write('\n')
+        buf.write(f'// {method} is the resolver for the {method[0].lower() + method[1:]} field.\n')
+        buf.write(f'func (r *queryResolver) {sig} {{\n')
+        buf.write(f'\treturn {zero}\n')
+        buf.write('}\n')
 
 # Generate subscription stubs
 for method in missing_subscriptions:
-    sig = extract_method_sig(interfaces["SubscriptionResolver"], method)
+    sig = sig_map["SubscriptionResolver"].get(method)
     if sig:
         ret = parse_return_type(sig)
         zero = gen_zero_return(ret)
-        stubs.append(f'// {method} is the resolver for the {method[0].lower() + method[1:]} field.')
-        stubs.append(f'func (r *subscriptionResolver) {sig} {{')
-        stubs.append(f'\treturn {zero}')
-        stubs.append('}')
-        stubs.append('')
+        buf.write('\n')
+        buf.write(f'// {method} is the resolver for the {method[0].lower() + method[1:]} field.\n')
+        buf.write(f'func (r *subscriptionResolver) {sig} {{\n')
+        buf.write(f'\treturn {zero}\n')
+        buf.write('}\n')
 
 # Write output
-output = "\n".join(stubs)
-with open("graph/resolver/stubs.resolvers.go", "w", encoding="utf-8") as f:
-    f.write(output)
+with open("graph/resolver/stubs.resolvers.go", "wb") as f:
+    f.write(buf.getvalue().encode("utf-8"))
 
 print(f"Generated {len(missing_mutations) + len(missing_queries) + len(missing_subscriptions)} stubs")
 print("Written to graph/resolver/stubs.resolvers.go")